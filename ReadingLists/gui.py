@@ -1,7 +1,48 @@
 import tkinter as tk
+from tkinter import filedialog, ttk
 import csv
+import io
 import os
-from typing import List, Dict
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple, Type
+
+_GENRES: Tuple[str, ...] = (
+    "Sci-Fi", "Action", "Fantasy", "Mystery", "Thriller",
+    "Horror", "Romance", "Drama", "YA", "Dystopian", "Crime",
+    "Biography", "Memoir", "Self-Help", "Health", "Travel",
+    "Business"
+)
+_MONTHS: Tuple[str, ...] = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+_TYPES: Tuple[str, ...] = ("Series", "Standalone")
+_READ_HEADER: List[str] = ["Title", "Author", "Rating", "Type", "Genres", "Month"]
+_TBR_HEADER: List[str] = ["Title", "Author", "Type"]
+_IO_BATCH_SIZE: int = 256
+_IO_POLL_MS: int = 100
+_DIALECT: Type[csv.Dialect] = csv.excel
+# _format_csv_row hard-codes these settings, so fail loudly if _DIALECT stops matching them
+assert (_DIALECT.delimiter, _DIALECT.quotechar, _DIALECT.lineterminator) == (",", '"', "\r\n")
+assert _DIALECT.quoting == csv.QUOTE_MINIMAL and _DIALECT.doublequote and _DIALECT.escapechar is None
+
+
+def _format_csv_row(row: List[str]) -> str:
+    """
+    Formats a row the way csv.writer does with the excel dialect (_DIALECT).
+
+    Fields are only quoted when they contain a comma, quote or line break.
+
+    :param row: List of values to format.
+    :return: The formatted line, including its line terminator.
+    """
+    fields = []
+    for field in row:
+        if "," in field or '"' in field or "\n" in field or "\r" in field:
+            field = '"' + field.replace('"', '""') + '"'
+        fields.append(field)
+    return ",".join(fields) + "\r\n"
 
 
 class BookTracker:
@@ -18,13 +59,31 @@ class BookTracker:
         self._window: tk.Tk = window
         self._read_status: tk.StringVar = tk.StringVar(value="To Be Read")
         self._type_var: tk.StringVar = tk.StringVar()
-        self._month_var: tk.StringVar = tk.StringVar(value="January")
+        self._month_var: tk.StringVar = tk.StringVar(value=_MONTHS[0])
+        self._files: Dict[str, io.TextIOWrapper] = {}
+        self._last_rating_cache: Optional[Tuple[str, float]] = None
+        self._io_queue: "queue.Queue[Optional[Tuple[str, List[List[str]], List[str], str]]]" = queue.Queue()
+        self._io_results: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        self._pending_saves: int = 0
+        self._poll_id: Optional[str] = None
+        self._writer_thread: threading.Thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
 
+        self._window.protocol("WM_DELETE_WINDOW", self._on_close)
         self._setup_gui()
+        self._add_common_fields()
+        self._build_read_panel()
+        self._build_tbr_panel()
         self._show_tbr_options()
 
     def _setup_gui(self) -> None:
-        """Sets up the main GUI layout and top radio buttons."""
+        """Sets up the main GUI layout, menu bar and top radio buttons."""
+        menu_bar = tk.Menu(self._window)
+        file_menu = tk.Menu(menu_bar, tearoff=0)
+        file_menu.add_command(label="Bulk Import from CSV", command=self._bulk_import)
+        menu_bar.add_cascade(label="File", menu=file_menu)
+        self._window.config(menu=menu_bar)
+
         # Top radio buttons for selecting book status
         top_frame = tk.Frame(self._window)
         top_frame.pack(pady=10)
@@ -38,78 +97,96 @@ class BookTracker:
         self._message_label: tk.Label = tk.Label(self._main_frame, text="", fg="red")
         self._message_label.pack()
 
-    def _show_read_options(self) -> None:
-        """Displays the input fields for books that have been read."""
-        self._clear_frame()
-        self._add_common_fields()
+    def _build_read_panel(self) -> None:
+        """Builds the panel of input fields for books that have been read."""
+        self._read_panel: tk.Frame = tk.Frame(self._main_frame)
+
+        self._rating_entry: tk.Entry = self._add_labeled_entry(self._read_panel, "Rating (0-10):")
+        self._entries_to_clear.append(self._rating_entry)
+        self._genre_bits: List[int] = [0] * len(_GENRES)
+        self._genre_buttons: List[tk.Checkbutton] = self._add_genre_checkboxes(self._read_panel, _GENRES)
+        self._add_dropdown(self._read_panel, "Month:", _MONTHS, self._month_var)
 
-        self._rating_entry: tk.Entry = self._add_labeled_entry("Rating (0-10):")
-        self._genre_vars: Dict[str, tk.IntVar] = self._add_genre_checkboxes([
-            "Sci-Fi", "Action", "Fantasy", "Mystery", "Thriller",
-            "Horror", "Romance", "Drama", "YA", "Dystopian", "Crime",
-            "Biography", "Memoir", "Self-Help", "Health", "Travel",
-            "Business"
-        ])
-        self._add_dropdown("Month:", [
-            "January", "February", "March", "April", "May", "June",
-            "July", "August", "September", "October", "November", "December"
-        ], self._month_var)
+        tk.Button(self._read_panel, text="Save", command=self._save_read_book).pack(pady=10)
 
-        tk.Button(self._main_frame, text="Save", command=self._save_read_book).pack(pady=10)
+    def _build_tbr_panel(self) -> None:
+        """Builds the panel of input fields for books that are to be read."""
+        self._tbr_panel: tk.Frame = tk.Frame(self._main_frame)
+        tk.Button(self._tbr_panel, text="Save", command=self._save_tbr_book).pack(pady=10)
+
+    def _show_read_options(self) -> None:
+        """Displays the input fields for books that have been read."""
+        self._tbr_panel.pack_forget()
+        self._read_panel.pack(fill=tk.X)
 
     def _show_tbr_options(self) -> None:
         """Displays the input fields for books that are to be read."""
-        self._clear_frame()
-        self._add_common_fields()
-        tk.Button(self._main_frame, text="Save", command=self._save_tbr_book).pack(pady=10)
+        self._read_panel.pack_forget()
+        self._tbr_panel.pack(fill=tk.X)
 
     def _add_common_fields(self) -> None:
         """Adds input fields common to both read and to be read books."""
-        self._title_entry: tk.Entry = self._add_labeled_entry("Title:")
-        self._author_entry: tk.Entry = self._add_labeled_entry("Author:")
+        self._title_entry: tk.Entry = self._add_labeled_entry(self._main_frame, "Title:")
+        self._author_entry: tk.Entry = self._add_labeled_entry(self._main_frame, "Author:")
+        self._entries_to_clear: List[tk.Entry] = [self._title_entry, self._author_entry]
 
         type_frame = tk.Frame(self._main_frame)
         type_frame.pack(anchor="w")
-        for text, val in [("Series", "Series"), ("Standalone", "Standalone")]:
-            tk.Radiobutton(type_frame, text=text, variable=self._type_var, value=val).pack(side=tk.LEFT)
+        for book_type in _TYPES:
+            tk.Radiobutton(type_frame, text=book_type, variable=self._type_var, value=book_type).pack(side=tk.LEFT)
 
-    def _add_labeled_entry(self, label_text: str) -> tk.Entry:
+    def _add_labeled_entry(self, parent: tk.Frame, label_text: str) -> tk.Entry:
         """
         Adds a labeled text entry to the GUI.
 
+        :param parent: The frame to add the entry to.
         :param label_text: Text to display as the label.
         :return: The Entry widget created.
         """
-        tk.Label(self._main_frame, text=label_text).pack(anchor="w")
-        entry = tk.Entry(self._main_frame)
+        tk.Label(parent, text=label_text).pack(anchor="w")
+        entry = tk.Entry(parent)
         entry.pack(fill=tk.X)
         return entry
 
-    def _add_genre_checkboxes(self, genres: List[str]) -> Dict[str, tk.IntVar]:
+    def _add_genre_checkboxes(self, parent: tk.Frame, genres: Tuple[str, ...]) -> List[tk.Checkbutton]:
         """
-        Adds checkboxes for genres.
+        Adds checkboxes for genres. Each checkbox toggles its entry in self._genre_bits.
 
-        :param genres: List of genre names.
-        :return: Dictionary mapping genre name to its IntVar.
+        :param parent: The frame to add the checkboxes to.
+        :param genres: Tuple of genre names.
+        :return: List of the Checkbutton widgets created, in genre order.
         """
-        variables: Dict[str, tk.IntVar] = {genre: tk.IntVar() for genre in genres}
+        buttons: List[tk.Checkbutton] = []
         for i in range(0, len(genres), 4):
-            row = tk.Frame(self._main_frame)
+            row = tk.Frame(parent)
             row.pack(anchor="w")
-            for genre in genres[i:i + 4]:
-                tk.Checkbutton(row, text=genre, variable=variables[genre]).pack(side=tk.LEFT)
-        return variables
+            for j in range(i, min(i + 4, len(genres))):
+                # Without a variable Tk keys the check state on the widget name, so it must be unique
+                button = tk.Checkbutton(row, text=genres[j], name=f"genre{j}",
+                                        command=lambda j=j: self._toggle_genre(j))
+                button.pack(side=tk.LEFT)
+                buttons.append(button)
+        return buttons
+
+    def _toggle_genre(self, index: int) -> None:
+        """
+        Flips the selected state of a genre.
+
+        :param index: Index of the genre in _GENRES.
+        """
+        self._genre_bits[index] ^= 1
 
-    def _add_dropdown(self, label: str, options: List[str], variable: tk.StringVar) -> None:
+    def _add_dropdown(self, parent: tk.Frame, label: str, options: Tuple[str, ...], variable: tk.StringVar) -> None:
         """
         Adds a dropdown menu to the GUI.
 
+        :param parent: The frame to add the dropdown to.
         :param label: The label for the dropdown.
-        :param options: List of options to display.
+        :param options: Tuple of options to display.
         :param variable: The StringVar linked to the selection.
         """
-        tk.Label(self._main_frame, text=label).pack(anchor="w")
-        tk.OptionMenu(self._main_frame, variable, *options).pack(fill=tk.X)
+        tk.Label(parent, text=label).pack(anchor="w")
+        ttk.Combobox(parent, textvariable=variable, values=options, state="readonly").pack(fill=tk.X)
 
     def _save_read_book(self) -> None:
         """Validates input and saves a read book to CSV."""
@@ -118,22 +195,15 @@ class BookTracker:
         rating = self._rating_entry.get().strip()
         book_type = self._type_var.get()
         month = self._month_var.get()
-        selected_genres = [g for g, var in self._genre_vars.items() if var.get()]
+        genres = ", ".join(g for g, bit in zip(_GENRES, self._genre_bits) if bit)
+        row = [title, author, rating, book_type, genres, month]
 
-        # Input validation
-        if not all([title, author, rating, book_type, month]):
-            self._message_label.config(text="Fill in all fields.", fg="red")
-            return
-        try:
-            rating_value = float(rating)
-            if not (0 <= rating_value <= 10):
-                raise ValueError
-        except ValueError:
-            self._message_label.config(text="Rating must be a number between 0 and 10.", fg="red")
+        error = self._validate_read_book(row)
+        if error:
+            self._message_label.config(text=error, fg="red")
             return
 
-        self._save_csv("read_books.csv", [title, author, rating, book_type, ", ".join(selected_genres), month],
-                       ["Title", "Author", "Rating", "Type", "Genres", "Month"])
+        self._save_csv("read_books.csv", row, _READ_HEADER)
         self._clear_entries()
 
     def _save_tbr_book(self) -> None:
@@ -141,14 +211,92 @@ class BookTracker:
         title = self._title_entry.get().strip()
         author = self._author_entry.get().strip()
         book_type = self._type_var.get()
+        row = [title, author, book_type]
 
-        if not all([title, author, book_type]):
-            self._message_label.config(text="Fill in all fields.", fg="red")
+        error = self._validate_tbr_book(row)
+        if error:
+            self._message_label.config(text=error, fg="red")
             return
 
-        self._save_csv("tbr.csv", [title, author, book_type], ["Title", "Author", "Type"])
+        self._save_csv("tbr.csv", row, _TBR_HEADER)
         self._clear_entries()
 
+    def _validate_read_book(self, row: List[str]) -> Optional[str]:
+        """
+        Checks a read book row before it is saved.
+
+        :param row: Title, author, rating, type, genres and month.
+        :return: An error message, or None if the row is valid.
+        """
+        title, author, rating, book_type, genres, month = row
+        if not (title and author and rating and book_type and month):
+            return "Fill in all fields."
+        if not (self._last_rating_cache and self._last_rating_cache[0] == rating):
+            try:
+                rating_value = float(rating)
+                if not (0 <= rating_value <= 10):
+                    raise ValueError
+            except ValueError:
+                return "Rating must be a number between 0 and 10."
+            self._last_rating_cache = (rating, rating_value)
+        if book_type not in _TYPES:
+            return "Type must be Series or Standalone."
+        if genres and any(genre not in _GENRES for genre in genres.split(", ")):
+            return "Genres must be from the genre list."
+        if month not in _MONTHS:
+            return "Month must be a month name."
+        return None
+
+    def _validate_tbr_book(self, row: List[str]) -> Optional[str]:
+        """
+        Checks a to-be-read book row before it is saved.
+
+        :param row: Title, author and type.
+        :return: An error message, or None if the row is valid.
+        """
+        title, author, book_type = row
+        if not (title and author and book_type):
+            return "Fill in all fields."
+        if book_type not in _TYPES:
+            return "Type must be Series or Standalone."
+        return None
+
+    def _bulk_import(self) -> None:
+        """Imports books from a user-selected CSV file into the currently selected list."""
+        source = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not source:
+            return
+
+        if self._read_status.get() == "Read":
+            filename, header, validate = "read_books.csv", _READ_HEADER, self._validate_read_book
+        else:
+            filename, header, validate = "tbr.csv", _TBR_HEADER, self._validate_tbr_book
+
+        try:
+            with open(source, newline="", encoding="utf-8-sig") as f:
+                reader = csv.reader(f, dialect=_DIALECT)
+                rows = [(reader.line_num, [field.strip() for field in row]) for row in reader if row]
+        except Exception as e:
+            self._message_label.config(text=f"Error reading file: {e}", fg="red")
+            return
+
+        if rows and rows[0][1] == header:
+            rows = rows[1:]
+        if not rows:
+            self._message_label.config(text="No books found to import.", fg="red")
+            return
+
+        for line_num, row in rows:
+            if len(row) != len(header):
+                error = f"Each row must have {len(header)} columns."
+            else:
+                error = validate(row)
+            if error:
+                self._message_label.config(text=f"Line {line_num}: {error}", fg="red")
+                return
+
+        self._save_csv_many(filename, [row for _, row in rows], header, f"Imported {len(rows)} book{'s' if len(rows) != 1 else ''}.")
+
     def _save_csv(self, filename: str, data: List[str], header: List[str]) -> None:
         """
         Saves data to a CSV file, creating the file and header if it doesn't exist.
@@ -157,31 +305,156 @@ class BookTracker:
         :param data: List of values to write.
         :param header: CSV header row.
         """
+        self._save_csv_many(filename, [data], header)
+
+    def _save_csv_many(self, filename: str, rows: List[List[str]], header: List[str],
+                       message: str = "Saved!") -> None:
+        """
+        Queues several rows to be saved to a CSV file in one write by the writer thread.
+
+        :param filename: CSV file name.
+        :param rows: List of rows to write.
+        :param header: CSV header row.
+        :param message: Message to show once the rows are saved.
+        """
+        self._io_queue.put((filename, rows, header, message))
+        self._pending_saves += 1
+        if self._poll_id is None:
+            self._poll_id = self._window.after(_IO_POLL_MS, self._poll_io_results)
+
+    def _writer_loop(self) -> None:
+        """
+        Writes queued rows to their CSV files until a None item is queued.
+
+        Runs on the writer thread, which owns the open files. Results are passed back
+        through self._io_results since Tk may only be used from the main thread.
+        """
+        while True:
+            batch = [self._io_queue.get()]
+            while len(batch) < _IO_BATCH_SIZE:
+                try:
+                    batch.append(self._io_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            if stop:
+                batch = batch[:batch.index(None)]
+            self._write_batch(batch)
+
+            if stop:
+                for f in self._files.values():
+                    try:
+                        f.close()
+                    except OSError:
+                        # Keep closing the other files; the window is already going away
+                        pass
+                self._files.clear()
+                return
+
+    def _write_batch(self, batch: List[Tuple[str, List[List[str]], List[str], str]]) -> None:
+        """
+        Writes a batch of queued saves with one write and flush per file.
+
+        Every queued save gets exactly one result, so a failure never leaves the poll waiting.
+
+        :param batch: List of (filename, rows, header, message) tuples.
+        """
         try:
-            is_new_file = not os.path.exists(filename) or os.path.getsize(filename) == 0
-            with open(filename, "a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                if is_new_file:
-                    writer.writerow(header)
-                writer.writerow(data)
-            self._message_label.config(text="Saved!", fg="green")
+            pending: Dict[str, Tuple[List[str], List[List[str]], List[str]]] = {}
+            for filename, rows, header, message in batch:
+                _, file_rows, messages = pending.setdefault(filename, (header, [], []))
+                file_rows.extend(rows)
+                messages.append(message)
         except Exception as e:
-            self._message_label.config(text=f"Error saving file: {e}", fg="red")
+            for _ in batch:
+                self._io_results.put((f"Error saving file: {e}", "red"))
+            return
+
+        for filename, (header, file_rows, messages) in pending.items():
+            try:
+                data = "".join(map(_format_csv_row, file_rows))
+                f = self._get_file(filename, header)
+                f.write(data)
+                f.flush()
+            except Exception as e:
+                self._discard_file(filename)
+                for _ in messages:
+                    self._io_results.put((f"Error saving file: {e}", "red"))
+            else:
+                for message in messages:
+                    self._io_results.put((message, "green"))
+
+    def _discard_file(self, filename: str) -> None:
+        """
+        Drops a cached file without flushing it, so rows from a failed save are never written later.
+
+        The next save reopens the file and checks the header again.
+
+        :param filename: CSV file name.
+        """
+        f = self._files.pop(filename, None)
+        if f is not None:
+            try:
+                f.buffer.raw.close()
+            except OSError:
+                pass
+
+    def _poll_io_results(self) -> None:
+        """
+        Shows the results of finished saves in the message label.
+
+        Polling is started by _save_csv_many and stops once every queued save has reported back.
+        """
+        try:
+            while True:
+                text, color = self._io_results.get_nowait()
+                self._message_label.config(text=text, fg=color)
+                self._pending_saves -= 1
+        except queue.Empty:
+            pass
+        if self._pending_saves:
+            self._poll_id = self._window.after(_IO_POLL_MS, self._poll_io_results)
+        else:
+            self._poll_id = None
+
+    def _get_file(self, filename: str, header: List[str]) -> io.TextIOWrapper:
+        """
+        Returns the open file for a CSV file name, opening it on first use.
+
+        The header is written when the file is new or empty.
+
+        :param filename: CSV file name.
+        :param header: CSV header row.
+        :return: The open file.
+        """
+        if filename not in self._files:
+            try:
+                is_new_file = os.stat(filename).st_size == 0
+            except FileNotFoundError:
+                is_new_file = True
+            raw = open(filename, "ab", buffering=0)
+            buf = io.BufferedWriter(raw, buffer_size=131072)
+            f = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=False)
+            if is_new_file:
+                f.write(_format_csv_row(header))
+            self._files[filename] = f
+        return self._files[filename]
 
-    def _clear_frame(self) -> None:
-        """Clears all widgets from the main frame except the message label."""
-        for widget in self._main_frame.winfo_children():
-            if widget != self._message_label:
-                widget.destroy()
+    def _on_close(self) -> None:
+        """Waits for queued saves to finish and the CSV files to close, then closes the window."""
+        if self._poll_id is not None:
+            self._window.after_cancel(self._poll_id)
+        self._io_queue.put(None)
+        self._writer_thread.join()
+        self._window.destroy()
 
     def _clear_entries(self) -> None:
         """Clears all input fields."""
-        for entry in [self._title_entry, self._author_entry]:
+        for entry in self._entries_to_clear:
             entry.delete(0, tk.END)
         self._type_var.set("")
-        if hasattr(self, "_rating_entry"):
-            self._rating_entry.delete(0, tk.END)
-        if hasattr(self, "_genre_vars"):
-            for var in self._genre_vars.values():
-                var.set(0)
-        self._month_var.set("January")
\ No newline at end of file
+        for i, button in enumerate(self._genre_buttons):
+            button.deselect()
+            self._genre_bits[i] = 0
+        self._month_var.set(_MONTHS[0])
\ No newline at end of file
@@ -0,0 +1,41 @@
+import csv
+import io
+import unittest
+from typing import List
+
+from gui import _format_csv_row
+
+
+class FormatCsvRowTest(unittest.TestCase):
+    """
+    Checks that _format_csv_row writes the same text as csv.writer.
+    """
+
+    def _assert_matches_csv_writer(self, row: List[str]) -> None:
+        """
+        Asserts that a row formats the same as csv.writer would write it.
+
+        :param row: List of values to format.
+        """
+        expected = io.StringIO()
+        csv.writer(expected).writerow(row)
+        self.assertEqual(_format_csv_row(row), expected.getvalue())
+
+    def test_plain_fields(self) -> None:
+        self._assert_matches_csv_writer(["Dune", "Frank Herbert", "9", "Series", "Sci-Fi", "May"])
+
+    def test_fields_needing_quotes(self) -> None:
+        for field in ["Fantasy, Crime", 'The "Best" Book', "line\rbreak", "line\nbreak", "a\r\nb", '"', ","]:
+            with self.subTest(field=field):
+                self._assert_matches_csv_writer([field, "Author", "Standalone"])
+
+    def test_empty_fields(self) -> None:
+        self._assert_matches_csv_writer(["", "Author", ""])
+        self._assert_matches_csv_writer(["Title", "", "", "Series", "", "January"])
+
+    def test_header(self) -> None:
+        self._assert_matches_csv_writer(["Title", "Author", "Rating", "Type", "Genres", "Month"])
+
+
+if __name__ == "__main__":
+    unittest.main()